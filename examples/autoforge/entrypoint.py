@@ -5,6 +5,8 @@ AutoForge Skill Entrypoint — Standard I/O Contract
 Input:  input/request.json
 Output: output/result.json
 
+Run with --serve to handle one JSON request per stdin line instead.
+
 Commands:
   - init: Initialize a new project
   - plan: Generate a spec from requirements (uses sessions_spawn)
@@ -16,12 +18,28 @@ This wrapper enables OpenClaw to invoke AutoForge uniformly.
 LLM calls are delegated to OpenClaw sub-agents via sessions_spawn.
 """
 
+import hashlib
 import json
 import os
-import subprocess
 import sys
+from bisect import bisect_right
+from itertools import islice
 from pathlib import Path
 
+# orjson is optional; the stdlib json module is the fallback
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj, indent: bool = True) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+    def _dumps(obj, indent: bool = True) -> str:
+        return json.dumps(obj, indent=2 if indent else None)
+
 SKILL_DIR = Path(__file__).parent.parent
 VENDOR_DIR = SKILL_DIR / "vendor"
 INPUT_DIR = SKILL_DIR / "input"
@@ -31,20 +49,65 @@ PROJECTS_DIR = SKILL_DIR / "projects"
 # Add vendor to Python path so we can import AutoForge modules
 sys.path.insert(0, str(VENDOR_DIR))
 
+SPEC_OPEN_TAG = "<project_specification>"
+SPEC_CLOSE_TAG = "</project_specification>"
+
+# Starting spec written by 'init'; {name} is replaced with the project name
+SPEC_TEMPLATE = b"""<project_specification>
+# Project: {name}
+
+## Overview
+[Describe what this project does]
+
+## Features
+- [ ] Feature 1
+- [ ] Feature 2
+
+## Technical Requirements
+[List technical requirements]
+
+</project_specification>
+"""
+
+
+def _write_json(path: Path, obj, indent: bool = True):
+    """
+    Write obj as JSON through a 64 KiB buffered handle.
+    
+    A serialization error must not leave path truncated: orjson encodes
+    before the file is opened, and the stdlib fallback streams with
+    json.dump (peak memory is the buffer, not a second copy of the
+    document) into a sibling temp file that then replaces path.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        with open(path, "wb", buffering=65536) as f:
+            f.write(data)
+        return
+    
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", buffering=65536) as f:
+            json.dump(obj, f, indent=2 if indent else None)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
 
 def load_request() -> dict:
     """Load the input request."""
     request_file = INPUT_DIR / "request.json"
     if not request_file.exists():
         return {"command": "help", "args": {}}
-    return json.loads(request_file.read_text())
+    return _loads(request_file.read_bytes())
 
 
 def save_result(result: dict):
     """Save the output result."""
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     result_file = OUTPUT_DIR / "result.json"
-    result_file.write_text(json.dumps(result, indent=2))
+    _write_json(result_file, result)
     print(f"Result written to: {result_file}")
 
 
@@ -75,6 +138,88 @@ def sessions_spawn(task: str, label: str, timeout: int = 300) -> dict:
     }
 
 
+def _cached_spawn(project_dir: Path, task: str, label: str, timeout: int = 300) -> dict:
+    """
+    sessions_spawn with a per-project result cache.
+    
+    Finished sub-agent results are stored under .autoforge/cache/, keyed by
+    a hash of the prompt and label, so a retried or resumed command reuses
+    them instead of spawning again. Set AUTOFORGE_NO_CACHE=1 to bypass.
+    """
+    if os.environ.get("AUTOFORGE_NO_CACHE") == "1":
+        return sessions_spawn(task=task, label=label, timeout=timeout)
+    
+    key = hashlib.sha256((task + "|" + label).encode()).hexdigest()
+    cache_file = project_dir / ".autoforge" / "cache" / f"{key}.json"
+    try:
+        return _loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        pass
+    
+    result = sessions_spawn(task=task, label=label, timeout=timeout)
+    if result.get("status") not in ("pending", "error"):
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        _write_json(cache_file, result, indent=False)
+    return result
+
+
+def _ready_tasks(tasks: list[dict], completed_set: frozenset) -> list[dict]:
+    """Return the incomplete tasks whose dependencies are all completed."""
+    return [
+        t for t in tasks
+        if t.get("id") not in completed_set
+        and completed_set.issuperset(t.get("dependencies") or [])  # null in LLM output
+    ]
+
+
+def _extract_tasks_object(text: str) -> dict | None:
+    """
+    Find the JSON object holding the "tasks" key in sub-agent output.
+    
+    One forward pass instead of a greedy regex: track string state and a
+    stack of open-brace offsets, and try each balanced object that spans a
+    "tasks" mention as it closes (innermost first). The first that parses
+    to an object with a "tasks" list wins, so prose or spec text mentioning
+    "tasks" earlier doesn't hide the real object.
+    """
+    mentions = []
+    pos = text.find('"tasks"')
+    while pos != -1:
+        mentions.append(pos)
+        pos = text.find('"tasks"', pos + 1)
+    if not mentions:
+        return None
+    
+    stack = []
+    in_string = False
+    escaped = False
+    for i, c in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+            elif c == "\n":
+                in_string = False  # JSON strings never span lines; stray prose quote
+        elif c == '"':
+            in_string = True
+        elif c == "{":
+            stack.append(i)
+        elif c == "}" and stack:
+            start = stack.pop()
+            k = bisect_right(mentions, start)
+            if k < len(mentions) and mentions[k] < i:
+                try:
+                    candidate = _loads(text[start:i + 1])
+                except ValueError:
+                    continue
+                if isinstance(candidate, dict) and isinstance(candidate.get("tasks"), list):
+                    return candidate
+    return None
+
+
 def cmd_help(args: dict) -> dict:
     """Show available commands."""
     return {
@@ -100,9 +245,10 @@ def cmd_help(args: dict) -> dict:
                 "description": "Execute the build with sub-agents",
                 "args": {
                     "project": "Project name (required)",
-                    "feature": "Specific feature to build (optional)"
+                    "feature": "Specific feature to build (optional)",
+                    "batch": "Dispatch all ready tasks at once (optional, default true)"
                 },
-                "note": "Spawns sub-agents for each task"
+                "note": "Spawns sub-agents for each task; independent tasks go out as one sessions_spawn_batch"
             },
             "status": {
                 "description": "Check project status",
@@ -124,35 +270,19 @@ def cmd_init(args: dict) -> dict:
     project_path = args.get("path") or str(PROJECTS_DIR / name)
     project_dir = Path(project_path)
     
-    # Create project structure
-    project_dir.mkdir(parents=True, exist_ok=True)
-    (project_dir / "prompts").mkdir(exist_ok=True)
-    (project_dir / ".autoforge").mkdir(exist_ok=True)
-    (project_dir / "src").mkdir(exist_ok=True)
+    # Create project structure (parents=True creates project_dir itself)
+    for sub in ("prompts", ".autoforge", "src"):
+        (project_dir / sub).mkdir(parents=True, exist_ok=True)
     
     # Create spec template
     spec_file = project_dir / "prompts" / "app_spec.txt"
     if not spec_file.exists():
-        spec_file.write_text(f"""<project_specification>
-# Project: {name}
-
-## Overview
-[Describe what this project does]
-
-## Features
-- [ ] Feature 1
-- [ ] Feature 2
-
-## Technical Requirements
-[List technical requirements]
-
-</project_specification>
-""")
+        spec_file.write_bytes(SPEC_TEMPLATE.replace(b"{name}", name.encode()))
     
     # Create tasks file
     tasks_file = project_dir / ".autoforge" / "tasks.json"
     if not tasks_file.exists():
-        tasks_file.write_text(json.dumps({"tasks": [], "completed": []}, indent=2))
+        _write_json(tasks_file, {"tasks": [], "completed": []}, indent=False)
     
     return {
         "status": "ok",
@@ -187,13 +317,9 @@ def cmd_plan(args: dict) -> dict:
     spec_file = project_dir / "prompts" / "app_spec.txt"
     tasks_file = project_dir / ".autoforge" / "tasks.json"
     
-    # Build the planning prompt
-    planning_prompt = f"""You are a technical architect. Create a detailed project specification and task breakdown.
-
-PROJECT: {project}
-
-REQUIREMENTS:
-{requirements}
+    # Build the planning prompt. Instructions come first and the
+    # per-request requirements last, so providers can cache the shared prefix.
+    planning_prompt = f"""You are a technical architect. Create a detailed project specification and task breakdown for the requirements at the end.
 
 Please provide:
 
@@ -218,10 +344,16 @@ Please provide:
    }}
 
 Be specific and actionable. Each task should be completable by a focused coding agent.
+
+PROJECT: {project}
+
+REQUIREMENTS:
+{requirements}
 """
 
     # Spawn a sub-agent to do the planning
-    spawn_result = sessions_spawn(
+    spawn_result = _cached_spawn(
+        project_dir,
         task=planning_prompt,
         label=f"autoforge-plan-{project}",
         timeout=300
@@ -247,20 +379,17 @@ Be specific and actionable. Each task should be completable by a focused coding
     output = spawn_result.get("output", "")
     
     # Extract spec (between <project_specification> tags)
-    import re
-    spec_match = re.search(r'<project_specification>(.*?)</project_specification>', output, re.DOTALL)
-    if spec_match:
-        spec_content = f"<project_specification>{spec_match.group(1)}</project_specification>"
-        spec_file.write_text(spec_content)
+    spec_start = output.find(SPEC_OPEN_TAG)
+    if spec_start != -1:
+        spec_end = output.find(SPEC_CLOSE_TAG, spec_start)
+        if spec_end != -1:
+            spec_content = output[spec_start:spec_end + len(SPEC_CLOSE_TAG)]
+            spec_file.write_text(spec_content)
     
     # Extract tasks JSON
-    tasks_match = re.search(r'\{[\s\S]*"tasks"[\s\S]*\}', output)
-    if tasks_match:
-        try:
-            tasks_data = json.loads(tasks_match.group())
-            tasks_file.write_text(json.dumps(tasks_data, indent=2))
-        except json.JSONDecodeError:
-            pass
+    tasks_data = _extract_tasks_object(output)
+    if tasks_data is not None:
+        _write_json(tasks_file, tasks_data, indent=False)
     
     return {
         "status": "ok",
@@ -292,9 +421,10 @@ def cmd_build(args: dict) -> dict:
         return {"status": "error", "summary": "No tasks found. Run 'plan' first.", "artifacts": []}
     
     # Load tasks
-    tasks_data = json.loads(tasks_file.read_text())
+    tasks_data = _loads(tasks_file.read_bytes())
     tasks = tasks_data.get("tasks", [])
     completed = tasks_data.get("completed", [])
+    completed_set = frozenset(completed)
     
     if not tasks:
         return {"status": "error", "summary": "No tasks defined. Run 'plan' first.", "artifacts": []}
@@ -308,7 +438,7 @@ def cmd_build(args: dict) -> dict:
                  or feature.lower() in t.get("description", "").lower()]
     
     # Find next incomplete task
-    pending_tasks = [t for t in tasks if t.get("id") not in completed]
+    pending_tasks = [t for t in tasks if t.get("id") not in completed_set]
     
     if not pending_tasks:
         return {
@@ -319,10 +449,17 @@ def cmd_build(args: dict) -> dict:
             "artifacts": []
         }
     
-    # Build the next task
-    task = pending_tasks[0]
-    
-    build_prompt = f"""You are a coding agent. Implement the following task.
+    # The prefix is identical for every task of a project, so providers can
+    # serve it from their prompt cache; only the task-specific suffix varies.
+    prompt_prefix = f"""You are a coding agent. Implement the task described at the end.
+
+For that task:
+1. Implement it completely
+2. Create/modify the necessary files
+3. Write tests if applicable
+4. Provide a summary of changes made
+
+Be thorough and production-ready.
 
 PROJECT: {project}
 WORKING DIRECTORY: {project_dir}
@@ -330,28 +467,57 @@ WORKING DIRECTORY: {project_dir}
 SPECIFICATION:
 {spec_content[:2000]}
 
-CURRENT TASK:
+---
+"""
+
+    def spawn_task(task: dict) -> dict:
+        prompt_suffix = f"""CURRENT TASK:
 ID: {task.get('id')}
 Name: {task.get('name')}
 Description: {task.get('description')}
 
-Dependencies: {task.get('dependencies', [])}
-
-Please:
-1. Implement this task completely
-2. Create/modify the necessary files
-3. Write tests if applicable
-4. Provide a summary of changes made
-
-Be thorough and production-ready.
+Dependencies: {sorted(task.get('dependencies') or [], key=str)}
 """
-
-    # Spawn a sub-agent to do the work
-    spawn_result = sessions_spawn(
-        task=build_prompt,
-        label=f"autoforge-build-{project}-{task.get('id')}",
-        timeout=600
-    )
+        # Spawn a sub-agent to do the work
+        return _cached_spawn(
+            project_dir,
+            task=prompt_prefix + prompt_suffix,
+            label=f"autoforge-build-{project}-{task.get('id')}",
+            timeout=600
+        )
+    
+    # Build the next task whose dependencies are met (or, if none are, the
+    # first pending one, e.g. for dependencies outside the feature filter)
+    ready = _ready_tasks(pending_tasks, completed_set)
+    task = ready[0] if ready else pending_tasks[0]
+    spawn_result = None
+    
+    # Hand every ready task to the orchestrator at once so they run in
+    # parallel. Orchestrators without batch support pass "batch": false to
+    # get one sessions_spawn per invocation.
+    if args.get("batch", True) and len(ready) > 1:
+        calls = []
+        for ready_task in ready:
+            result = spawn_task(ready_task)
+            if result.get("status") != "pending":
+                # Already finished (cached) - record it via the single-task path
+                task, spawn_result = ready_task, result
+                break
+            calls.append(result["action"]["params"])
+        else:
+            return {
+                "status": "pending",
+                "summary": f"{len(calls)} build tasks require OpenClaw sub-agents",
+                "tasks": ready,
+                "action_required": {
+                    "tool": "sessions_spawn_batch",
+                    "params": {"calls": calls}
+                },
+                "artifacts": []
+            }
+    
+    if spawn_result is None:
+        spawn_result = spawn_task(task)
     
     if spawn_result.get("status") == "pending":
         return {
@@ -373,7 +539,7 @@ Be thorough and production-ready.
     # Mark task as completed
     completed.append(task.get("id"))
     tasks_data["completed"] = completed
-    tasks_file.write_text(json.dumps(tasks_data, indent=2))
+    _write_json(tasks_file, tasks_data, indent=False)
     
     return {
         "status": "ok",
@@ -386,10 +552,18 @@ Be thorough and production-ready.
         },
         "artifacts": [],
         "sub_agent_result": spawn_result,
-        "next": pending_tasks[1] if len(pending_tasks) > 1 else None
+        "next": next((t for t in pending_tasks if t is not task), None)
     }
 
 
+def _load_tasks(tasks_file: Path) -> dict:
+    """Load a tasks.json file; a missing or unreadable file counts as empty."""
+    try:
+        return _loads(tasks_file.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
 def cmd_status(args: dict) -> dict:
     """Check project status."""
     project = args.get("project")
@@ -400,19 +574,16 @@ def cmd_status(args: dict) -> dict:
             return {"status": "ok", "summary": "No projects found", "projects": [], "artifacts": []}
         
         projects = []
-        for p in PROJECTS_DIR.iterdir():
-            if p.is_dir() and not p.name.startswith('.'):
-                tasks_file = p / ".autoforge" / "tasks.json"
-                tasks_data = {}
-                if tasks_file.exists():
-                    try:
-                        tasks_data = json.loads(tasks_file.read_text())
-                    except:
-                        pass
+        with os.scandir(PROJECTS_DIR) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False) or entry.name.startswith("."):
+                    continue
                 
+                p = Path(entry.path)
+                tasks_data = _load_tasks(p / ".autoforge" / "tasks.json")
                 projects.append({
-                    "name": p.name,
-                    "path": str(p),
+                    "name": entry.name,
+                    "path": entry.path,
                     "has_spec": (p / "prompts" / "app_spec.txt").exists(),
                     "tasks": len(tasks_data.get("tasks", [])),
                     "completed": len(tasks_data.get("completed", []))
@@ -433,15 +604,13 @@ def cmd_status(args: dict) -> dict:
     spec_file = project_dir / "prompts" / "app_spec.txt"
     tasks_file = project_dir / ".autoforge" / "tasks.json"
     
-    tasks_data = {}
-    if tasks_file.exists():
-        try:
-            tasks_data = json.loads(tasks_file.read_text())
-        except:
-            pass
+    tasks_data = _load_tasks(tasks_file)
     
     tasks = tasks_data.get("tasks", [])
     completed = tasks_data.get("completed", [])
+    completed_set = frozenset(completed)
+    # Ids in "completed" that no longer match a task must not reduce the count
+    pending_count = len(tasks) - len(completed_set & {t.get("id") for t in tasks})
     
     return {
         "status": "ok",
@@ -453,10 +622,10 @@ def cmd_status(args: dict) -> dict:
             "tasks": {
                 "total": len(tasks),
                 "completed": len(completed),
-                "pending": len([t for t in tasks if t.get("id") not in completed])
+                "pending": pending_count
             }
         },
-        "pending_tasks": [t for t in tasks if t.get("id") not in completed][:5],
+        "pending_tasks": list(islice((t for t in tasks if t.get("id") not in completed_set), 5)),
         "artifacts": []
     }
 
@@ -470,15 +639,11 @@ COMMANDS = {
 }
 
 
-def main():
-    request = load_request()
+def dispatch(request: dict) -> dict:
+    """Run one request and return its result with the required fields set."""
     command = request.get("command", "help")
     args = request.get("args", {})
     
-    print(f"Skill: autoforge")
-    print(f"Command: {command}")
-    print(f"Args: {json.dumps(args)}")
-    
     if command in COMMANDS:
         result = COMMANDS[command](args)
     else:
@@ -491,6 +656,55 @@ def main():
     
     result.setdefault("command", command)
     result.setdefault("artifacts", [])
+    return result
+
+
+def _serve():
+    """
+    Worker mode: read one JSON request per stdin line, answer with one JSON
+    result per stdout line. Lets the orchestrator keep a warm interpreter
+    across init/plan/build/status calls instead of starting one per request.
+    """
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            break
+        if not line.strip():
+            continue
+        try:
+            request = _loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("expected a JSON object")
+        except ValueError as e:
+            result = {"status": "error", "summary": f"Invalid request: {e}", "artifacts": []}
+        else:
+            try:
+                result = dispatch(request)
+            except Exception as e:
+                # A failing command must not take the warm worker down with it
+                result = {
+                    "status": "error",
+                    "command": request.get("command", "help"),
+                    "summary": f"{type(e).__name__}: {e}",
+                    "artifacts": [],
+                }
+        sys.stdout.write(_dumps(result, indent=False) + "\n")
+        sys.stdout.flush()
+
+
+def main():
+    if "--serve" in sys.argv:
+        _serve()
+        return
+    
+    request = load_request()
+    command = request.get("command", "help")
+    
+    print(f"Skill: autoforge")
+    print(f"Command: {command}")
+    print(f"Args: {json.dumps(request.get('args', {}))}")
+    
+    result = dispatch(request)
     
     save_result(result)
     sys.exit(0 if result.get("status") == "ok" else 1)
@@ -16,14 +16,14 @@ Features:
     - Outputs ready-to-use skill directory
 """
 
-import argparse
 import json
+import mmap
 import os
 import re
-import shutil
-import subprocess
 import sys
-import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
@@ -31,17 +31,23 @@ from typing import Optional
 # Project Type Detection
 # ============================================================================
 
-PROJECT_SIGNATURES = {
-    "python": ["pyproject.toml", "setup.py", "requirements.txt", "Pipfile"],
-    "node": ["package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml"],
+# Language/toolchain families; a repo has one, so detection stops at the first
+# hit. Ordered most specific first.
+_PRIMARY_SIGS = {
     "rust": ["Cargo.toml", "Cargo.lock"],
     "go": ["go.mod", "go.sum"],
+    "node": ["package.json"],
+    "python": ["pyproject.toml", "setup.py", "requirements.txt", "Pipfile"],
     "ruby": ["Gemfile", "Gemfile.lock", "*.gemspec"],
     "java": ["pom.xml", "build.gradle", "build.gradle.kts"],
     "dotnet": ["*.csproj", "*.sln", "*.fsproj"],
+}
+
+# Deployment/infra types that layer on top of any primary family
+_OVERLAY_SIGS = {
     "terraform": ["*.tf", "terraform.tfstate"],
     "docker": ["Dockerfile", "docker-compose.yml", "docker-compose.yaml"],
-    "k8s": ["*.yaml", "*.yml"],  # Will check for kind: Deployment etc.
+    "k8s": ["*.yaml", "*.yml"],  # Confirmed by a manifest header, see _has_k8s_manifest
 }
 
 DOC_FILES = [
@@ -69,6 +75,28 @@ LLM_PATTERNS = [
     (r"OPENAI_API_KEY", "openai"),
 ]
 
+# Directories that never contribute to analysis (VCS data, deps, build output)
+IGNORE_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__", ".pytest_cache",
+               "target", "dist", "build", ".next", ".cache", "coverage"}
+
+# Read limits: README excerpt, documentation copied to references/, and
+# config files parsed with the regex fallbacks (never this large in practice)
+MAX_README_BYTES = 10000
+MAX_DOC_BYTES = 50000
+MAX_CONFIG_BYTES = 64 * 1024
+DOC_READ_TIMEOUT = 10  # seconds, per file, for concurrent reads
+
+# Fallback metadata parsing for TOML files and Makefile target discovery
+_NAME_RE = re.compile(r'name\s*=\s*"([^"]+)"')
+_DESC_RE = re.compile(r'description\s*=\s*"([^"]+)"')
+_MAKE_TARGET_RE = re.compile(r"^([a-zA-Z_][a-zA-Z0-9_-]*):", re.MULTILINE)
+
+# github.com/<owner>/<repo> in https or scp-style ssh form
+_GITHUB_URL_RE = re.compile(r"^(?:https?://github\.com/|git@github\.com:)([^/]+)/([^/]+?)(?:\.git)?/?$")
+
+# Source files scanned for LLM API usage
+CODE_EXTENSIONS = {".py", ".js", ".ts", ".jsx", ".tsx", ".rs", ".go"}
+
 CONFIG_FILES = {
     "python": ["pyproject.toml", "setup.py", "setup.cfg"],
     "node": ["package.json", "tsconfig.json"],
@@ -77,30 +105,287 @@ CONFIG_FILES = {
 }
 
 
-def detect_project_type(repo_path: Path) -> list[str]:
-    """Detect project type(s) from file signatures."""
+# ============================================================================
+# Repository Index
+# ============================================================================
+
+@dataclass
+class RepoIndex:
+    """Snapshot of a repository's layout, built in a single directory walk."""
+    root: Path
+    basenames: set[str] = field(default_factory=set)
+    extensions: set[str] = field(default_factory=set)
+    top_level: dict[str, Path] = field(default_factory=dict)
+    src_entries: set[str] = field(default_factory=set)
+    has_config_dir: bool = False
+    has_tests_dir: bool = False
+    doc_hits: dict[str, Path] = field(default_factory=dict)
+    yaml_files: list[Path] = field(default_factory=list)
+    code_files: list[Path] = field(default_factory=list)
+    tree_lines: list[str] = field(default_factory=list)
+
+
+def _render_tree(
+    listing: dict[str, list[tuple[str, bool, bool]]],
+    max_depth: int,
+    max_files: int,
+) -> list[str]:
+    """Render directory listings (relative dir -> [(name, is_dir, is_file)]) as tree lines."""
+    
+    def children(rel: str):
+        # Sorting happens only for directories the tree actually reaches
+        entries = listing.get(rel, [])
+        entries.sort(key=lambda e: (not e[1], e[0].lower()))
+        last = len(entries) - 1
+        return ((i == last, name, is_dir) for i, (name, is_dir, _) in enumerate(entries))
+    
+    lines = []
+    stack = [(children(""), "", "", 0)]
+    
+    while stack:
+        entries, rel, prefix, depth = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
+        
+        if len(lines) >= max_files:
+            lines.append(f"{prefix}...")
+            break
+        
+        is_last, name, is_dir = entry
+        connector = "└── " if is_last else "├── "
+        lines.append(f"{prefix}{connector}{name}")
+        
+        if is_dir and depth < max_depth:
+            extension = "    " if is_last else "│   "
+            stack.append((children(f"{rel}{name}/"), f"{rel}{name}/", prefix + extension, depth + 1))
+    
+    return lines
+
+
+def _is_ignored(name: str) -> bool:
+    """Skip hidden and common ignore dirs."""
+    return name in IGNORE_DIRS or name.startswith(".")
+
+
+def _scan_listing(
+    repo_path: Path, follow_top_level: frozenset[str] = frozenset(),
+) -> dict[str, list[tuple[str, bool, bool]]]:
+    """List every non-ignored directory of the worktree with os.scandir.
+    
+    Symlinks are never followed, except the top-level entries named in
+    follow_top_level (the directory links of the local-path sandbox).
+    """
+    listing = {}
+    pending = deque([(str(repo_path), "")])
+    
+    while pending:
+        path, rel = pending.popleft()
+        children = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if _is_ignored(entry.name):
+                        continue
+                    is_dir = entry.is_dir(follow_symlinks=not rel and entry.name in follow_top_level)
+                    children.append((entry.name, is_dir, not is_dir and entry.is_file()))
+                    if is_dir:
+                        pending.append((entry.path, f"{rel}{entry.name}/"))
+        except OSError:
+            continue
+        listing[rel] = children
+    
+    return listing
+
+
+def _git_listing(repo_path: Path) -> Optional[dict[str, list[tuple[str, bool, bool]]]]:
+    """List the tree committed at HEAD from a single `git ls-tree` call.
+    
+    git already knows the full tree, so this replaces a getdents/stat per
+    directory with one packed stream, and never touches blobs (which a
+    blobless clone would otherwise fetch lazily). Returns None when git or
+    HEAD is unavailable, so the caller can fall back to scanning.
+    """
+    import shutil
+    import subprocess
+    
+    git = shutil.which("git")
+    if git is None:
+        return None
+    
+    try:
+        with subprocess.Popen(
+            [git, "-C", str(repo_path), "ls-tree", "-r", "-z", "HEAD"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=False,
+        ) as proc:
+            out = proc.stdout.read()
+    except OSError:
+        return None
+    if proc.returncode != 0:
+        return None
+    
+    listing = {"": []}
+    for record in out.split(b"\0"):
+        # "<mode> <type> <object>\t<path>"; submodules show up as type "commit"
+        meta, _, path = record.partition(b"\t")
+        if not path:
+            continue
+        parts = os.fsdecode(path).split("/")
+        if any(_is_ignored(part) for part in parts):
+            continue
+        
+        rel = ""
+        for part in parts[:-1]:
+            child = f"{rel}{part}/"
+            if child not in listing:
+                listing[rel].append((part, True, False))
+                listing[child] = []
+            rel = child
+        
+        if meta.split(b" ", 2)[1] == b"commit":
+            listing[rel].append((parts[-1], True, False))
+            listing.setdefault(f"{rel}{parts[-1]}/", [])
+        else:
+            listing[rel].append((parts[-1], False, True))
+    
+    return listing
+
+
+def _build_index(
+    repo_path: Path,
+    max_depth: int = 3,
+    max_files: int = 50,
+    follow_top_level: frozenset[str] = frozenset(),
+    use_git: bool = False,
+) -> RepoIndex:
+    """List the repo once and collect everything the analyzers need.
+    
+    With use_git, meant for clones skillify made itself (whose worktree is
+    HEAD), a checkout is listed from HEAD's tree. Everything else, including
+    local checkouts with uncommitted changes, is scanned.
+    """
+    index = RepoIndex(root=repo_path)
+    doc_files = set(DOC_FILES)
+    
+    listing = None
+    if use_git and (repo_path / ".git").exists():
+        listing = _git_listing(repo_path)
+    if listing is None:
+        listing = _scan_listing(repo_path, follow_top_level)
+    
+    root = str(repo_path)
+    pending = deque([("", 0)])
+    
+    while pending:
+        rel, depth = pending.popleft()
+        children = listing.get(rel, [])
+        prefix = os.path.join(root, rel)
+        
+        for name, is_dir, is_file in children:
+            path = prefix + name
+            if depth == 0:
+                index.top_level[name] = Path(path)
+            elif rel == "src/":
+                index.src_entries.add(name)
+            
+            if is_dir:
+                pending.append((f"{rel}{name}/", depth + 1))
+            elif is_file:
+                index.basenames.add(name)
+                ext = os.path.splitext(name)[1]
+                index.extensions.add(ext)
+                if ext in CODE_EXTENSIONS:
+                    index.code_files.append(Path(path))
+                elif ext in (".yaml", ".yml"):
+                    index.yaml_files.append(Path(path))
+                if rel + name in doc_files:
+                    index.doc_hits[rel + name] = Path(path)
+        
+        if rel == "config/" and children:
+            index.has_config_dir = True
+        elif rel == "tests/" and children:
+            index.has_tests_dir = True
+    
+    index.tree_lines = _render_tree(listing, max_depth, max_files)
+    return index
+
+
+# ============================================================================
+# Analyzers
+# ============================================================================
+
+def _read_head(path: Path, limit: int) -> str:
+    """Read the first `limit` bytes of a text file, decoded leniently.
+    
+    Files larger than the limit are memory-mapped so only the pages holding
+    the prefix are paged in and copied; smaller ones are read directly
+    (mmap also cannot map empty files). Newlines are normalized as text
+    mode would.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= limit:
+            data = f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = mm[:limit]
+    return data.decode("utf-8", "replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _signature_present(sig: str, index: RepoIndex) -> bool:
+    """Check a single project signature against the index."""
+    if "*" in sig:
+        # Glob pattern — "*.tf" matches on the extension
+        return sig[sig.rindex("*") + 1:] in index.extensions
+    return sig in index.basenames
+
+
+def _has_k8s_manifest(index: RepoIndex) -> bool:
+    """Check whether any YAML file starts like a Kubernetes manifest."""
+    for path in index.yaml_files:
+        try:
+            with open(path, "rb") as f:
+                head = f.read(256)
+        except OSError:
+            continue
+        if b"kind:" in head and b"apiVersion:" in head:
+            return True
+    return False
+
+
+def detect_project_type(index: RepoIndex, fast: bool = False) -> list[str]:
+    """Detect project type(s) from file signatures.
+    
+    Returns the first matching primary family plus any overlay types
+    (terraform, docker, k8s). With fast=True the overlay checks are skipped.
+    """
     types = []
-    files = set(f.name for f in repo_path.rglob("*") if f.is_file())
-    
-    for proj_type, signatures in PROJECT_SIGNATURES.items():
-        for sig in signatures:
-            if "*" in sig:
-                # Glob pattern
-                pattern = sig.replace("*", "")
-                if any(f.endswith(pattern) for f in files):
-                    types.append(proj_type)
-                    break
-            elif sig in files:
+    
+    for proj_type, signatures in _PRIMARY_SIGS.items():
+        if any(_signature_present(sig, index) for sig in signatures):
+            types.append(proj_type)
+            break
+    
+    if not fast:
+        for proj_type, signatures in _OVERLAY_SIGS.items():
+            if any(_signature_present(sig, index) for sig in signatures):
+                # Nearly every repo has YAML (CI configs); require a real manifest
+                if proj_type == "k8s" and not _has_k8s_manifest(index):
+                    continue
                 types.append(proj_type)
-                break
     
-    return list(set(types)) or ["generic"]
+    return types or ["generic"]
 
 
-def get_project_metadata(repo_path: Path, project_types: list[str]) -> dict:
-    """Extract metadata from project config files."""
+def get_project_metadata(
+    index: RepoIndex, project_types: list[str], default_name: Optional[str] = None,
+) -> dict:
+    """Extract metadata from project config files.
+    
+    The name falls back to default_name, then to the directory name.
+    """
     metadata = {
-        "name": repo_path.name,
+        "name": default_name or index.root.name,
         "description": "",
         "version": "",
         "scripts": {},
@@ -108,8 +393,8 @@ def get_project_metadata(repo_path: Path, project_types: list[str]) -> dict:
     }
     
     # Try package.json
-    pkg_json = repo_path / "package.json"
-    if pkg_json.exists():
+    pkg_json = index.top_level.get("package.json")
+    if pkg_json:
         try:
             with open(pkg_json) as f:
                 pkg = json.load(f)
@@ -122,8 +407,8 @@ def get_project_metadata(repo_path: Path, project_types: list[str]) -> dict:
             pass
     
     # Try pyproject.toml
-    pyproject = repo_path / "pyproject.toml"
-    if pyproject.exists():
+    pyproject = index.top_level.get("pyproject.toml")
+    if pyproject:
         try:
             import tomllib
             with open(pyproject, "rb") as f:
@@ -136,9 +421,9 @@ def get_project_metadata(repo_path: Path, project_types: list[str]) -> dict:
         except (ImportError, IOError):
             # tomllib not available (Python < 3.11), try regex
             try:
-                content = pyproject.read_text()
-                name_match = re.search(r'name\s*=\s*"([^"]+)"', content)
-                desc_match = re.search(r'description\s*=\s*"([^"]+)"', content)
+                content = _read_head(pyproject, MAX_CONFIG_BYTES)
+                name_match = _NAME_RE.search(content)
+                desc_match = _DESC_RE.search(content)
                 if name_match:
                     metadata["name"] = name_match.group(1)
                 if desc_match:
@@ -147,12 +432,12 @@ def get_project_metadata(repo_path: Path, project_types: list[str]) -> dict:
                 pass
     
     # Try Cargo.toml
-    cargo = repo_path / "Cargo.toml"
-    if cargo.exists():
+    cargo = index.top_level.get("Cargo.toml")
+    if cargo:
         try:
-            content = cargo.read_text()
-            name_match = re.search(r'name\s*=\s*"([^"]+)"', content)
-            desc_match = re.search(r'description\s*=\s*"([^"]+)"', content)
+            content = _read_head(cargo, MAX_CONFIG_BYTES)
+            name_match = _NAME_RE.search(content)
+            desc_match = _DESC_RE.search(content)
             if name_match:
                 metadata["name"] = name_match.group(1)
             if desc_match:
@@ -163,76 +448,82 @@ def get_project_metadata(repo_path: Path, project_types: list[str]) -> dict:
     return metadata
 
 
-def get_readme_content(repo_path: Path) -> str:
+def get_readme_content(index: RepoIndex) -> str:
     """Get README content."""
     for readme_name in ["README.md", "README.rst", "README.txt", "README"]:
-        readme = repo_path / readme_name
-        if readme.exists():
+        readme = index.doc_hits.get(readme_name)
+        if readme:
             try:
-                return readme.read_text()[:10000]  # Limit size
+                return _read_head(readme, MAX_README_BYTES)
             except IOError:
                 pass
     return ""
 
 
-def get_directory_tree(repo_path: Path, max_depth: int = 3, max_files: int = 50) -> str:
+def get_directory_tree(index: RepoIndex) -> str:
     """Generate a directory tree string."""
-    lines = []
-    file_count = 0
+    return "\n".join(index.tree_lines)
+
+
+def _read_doc(path: Path) -> Optional[str]:
+    """Read a documentation file, or None if it is too large to include."""
+    if path.stat().st_size >= MAX_DOC_BYTES:
+        return None  # Skip very large files without reading them
+    return path.read_text(errors="replace")
+
+
+async def _read_doc_async(doc_file: str, path: Path) -> tuple[str, Optional[str]]:
+    """Read a documentation file with aiofiles, giving up after DOC_READ_TIMEOUT."""
+    import asyncio
+    import aiofiles
     
-    def walk(path: Path, prefix: str = "", depth: int = 0):
-        nonlocal file_count
-        if depth > max_depth or file_count > max_files:
-            return
-        
-        # Skip hidden and common ignore dirs
-        ignore = {".git", ".venv", "venv", "node_modules", "__pycache__", ".pytest_cache", 
-                  "target", "dist", "build", ".next", ".cache", "coverage"}
-        
-        try:
-            entries = sorted(path.iterdir(), key=lambda e: (not e.is_dir(), e.name.lower()))
-        except PermissionError:
-            return
-        
-        for i, entry in enumerate(entries):
-            if entry.name in ignore or entry.name.startswith("."):
-                continue
-            
-            file_count += 1
-            if file_count > max_files:
-                lines.append(f"{prefix}...")
-                return
-            
-            is_last = i == len(entries) - 1
-            connector = "└── " if is_last else "├── "
-            lines.append(f"{prefix}{connector}{entry.name}")
-            
-            if entry.is_dir():
-                extension = "    " if is_last else "│   "
-                walk(entry, prefix + extension, depth + 1)
+    async def read() -> Optional[str]:
+        if path.stat().st_size >= MAX_DOC_BYTES:
+            return None
+        async with aiofiles.open(path, "r", errors="replace") as f:
+            return await f.read()
     
-    walk(repo_path)
-    return "\n".join(lines)
+    try:
+        return doc_file, await asyncio.wait_for(read(), DOC_READ_TIMEOUT)
+    except (OSError, asyncio.TimeoutError):
+        return doc_file, None
 
 
-def extract_key_files(repo_path: Path) -> dict[str, str]:
+async def _gather_docs(hits: list[tuple[str, Path]]) -> dict[str, str]:
+    """Read all documentation files concurrently."""
+    import asyncio
+    
+    results = await asyncio.gather(*(_read_doc_async(doc, path) for doc, path in hits))
+    return {doc: content for doc, content in results if content is not None}
+
+
+def extract_key_files(index: RepoIndex) -> dict[str, str]:
     """Extract content of key documentation files."""
-    key_files = {}
+    hits = [(doc, index.doc_hits[doc]) for doc in DOC_FILES if doc in index.doc_hits]
     
-    for doc_file in DOC_FILES:
-        file_path = repo_path / doc_file
-        if file_path.exists():
-            try:
-                content = file_path.read_text()
-                if len(content) < 50000:  # Skip very large files
-                    key_files[doc_file] = content
-            except IOError:
-                pass
+    try:
+        # Concurrent reads pay off on network-backed filesystems
+        import aiofiles  # noqa: F401
+    except ImportError:
+        aiofiles = None
+    
+    if aiofiles is not None and len(hits) > 1:
+        import asyncio
+        return asyncio.run(_gather_docs(hits))
+    
+    key_files = {}
+    for doc_file, file_path in hits:
+        try:
+            content = _read_doc(file_path)
+            if content is not None:
+                key_files[doc_file] = content
+        except IOError:
+            pass
     
     return key_files
 
 
-def detect_llm_usage(repo_path: Path) -> dict:
+def detect_llm_usage(index: RepoIndex) -> dict:
     """Detect LLM API usage in the codebase."""
     findings = {
         "has_llm_calls": False,
@@ -240,25 +531,15 @@ def detect_llm_usage(repo_path: Path) -> dict:
         "files": [],
     }
     
-    # Only scan code files
-    code_extensions = {".py", ".js", ".ts", ".jsx", ".tsx", ".rs", ".go"}
-    
-    for file_path in repo_path.rglob("*"):
-        if not file_path.is_file():
-            continue
-        if file_path.suffix not in code_extensions:
-            continue
-        # Skip common non-source dirs
-        if any(p in file_path.parts for p in [".git", "node_modules", ".venv", "venv", "__pycache__"]):
-            continue
-        
+    # Only code files, already collected (outside ignored dirs) by the index walk
+    for file_path in index.code_files:
         try:
             content = file_path.read_text(errors="ignore")
             for pattern, provider in LLM_PATTERNS:
                 if re.search(pattern, content):
                     findings["has_llm_calls"] = True
                     findings["providers"].add(provider)
-                    rel_path = str(file_path.relative_to(repo_path))
+                    rel_path = str(file_path.relative_to(index.root))
                     if rel_path not in findings["files"]:
                         findings["files"].append(rel_path)
                     break  # One match per file is enough
@@ -372,6 +653,20 @@ import subprocess
 import sys
 from pathlib import Path
 
+# orjson is optional; the stdlib json module is the fallback
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 SKILL_DIR = Path(__file__).parent.parent
 VENDOR_DIR = SKILL_DIR / "vendor"
 INPUT_DIR = SKILL_DIR / "input"
@@ -386,14 +681,17 @@ def load_request() -> dict:
     request_file = INPUT_DIR / "request.json"
     if not request_file.exists():
         return {{"command": "help", "args": {{}}}}
-    return json.loads(request_file.read_text())
+    return _loads(request_file.read_bytes())
 
 
 def save_result(result: dict):
     """Save the output result."""
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     result_file = OUTPUT_DIR / "result.json"
-    result_file.write_text(json.dumps(result, indent=2))
+    if orjson is not None:
+        result_file.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        result_file.write_text(_dumps(result))
     print(f"Result written to: {{result_file}}")
 
 
@@ -501,21 +799,21 @@ if __name__ == "__main__":
 '''
 
 
-def detect_entry_points(repo_path: Path, project_types: list[str]) -> list[str]:
+def detect_entry_points(index: RepoIndex, project_types: list[str]) -> list[str]:
     """Detect common entry points and commands."""
     entry_points = []
     
     # Check for common executables
     for name in ["main.py", "app.py", "cli.py", "index.js", "main.rs", "main.go"]:
-        if (repo_path / name).exists() or (repo_path / "src" / name).exists():
+        if name in index.top_level or name in index.src_entries:
             entry_points.append(name)
     
     # Check Makefile targets
-    makefile = repo_path / "Makefile"
-    if makefile.exists():
+    makefile = index.top_level.get("Makefile")
+    if makefile:
         try:
             content = makefile.read_text()
-            targets = re.findall(r"^([a-zA-Z_][a-zA-Z0-9_-]*):", content, re.MULTILINE)
+            targets = _MAKE_TARGET_RE.findall(content)
             for target in targets[:10]:  # Limit
                 if target not in ["all", "clean", "install", "test", "build"]:
                     entry_points.append(f"make {target}")
@@ -525,8 +823,8 @@ def detect_entry_points(repo_path: Path, project_types: list[str]) -> list[str]:
             pass
     
     # Check package.json scripts
-    pkg_json = repo_path / "package.json"
-    if pkg_json.exists():
+    pkg_json = index.top_level.get("package.json")
+    if pkg_json:
         try:
             with open(pkg_json) as f:
                 pkg = json.load(f)
@@ -543,14 +841,19 @@ def detect_entry_points(repo_path: Path, project_types: list[str]) -> list[str]:
 # ============================================================================
 
 def generate_skill_md(
-    repo_path: Path,
+    index: RepoIndex,
     project_types: list[str],
     metadata: dict,
     entry_points: list[str],
     tree: str,
     readme: str,
+    packed_references: Optional[list[str]] = None,
 ) -> str:
-    """Generate SKILL.md content."""
+    """Generate SKILL.md content.
+    
+    packed_references lists the members of references/references.tar when
+    documentation was packed instead of written as files.
+    """
     
     name = metadata["name"].replace("_", "-").lower()
     description = metadata["description"] or f"Work with the {metadata['name']} codebase."
@@ -639,15 +942,21 @@ cargo build
 """
 
     # Add references section
-    skill_md += """## References
+    refs_where = "`references/references.tar`" if packed_references is not None else "`references/`"
+    skill_md += f"""## References
 
-See `references/` for detailed documentation:
+See {refs_where} for detailed documentation:
 
 """
     
-    for doc in DOC_FILES[:5]:
-        doc_name = Path(doc).stem.upper()
-        skill_md += f"- [{doc_name}](references/{Path(doc).name})\n"
+    if packed_references is not None:
+        # Archive members can't be linked; name the ones actually packed
+        for member in packed_references:
+            skill_md += f"- {Path(member).stem.upper()}: `{member}`\n"
+    else:
+        for doc in DOC_FILES[:5]:
+            doc_name = Path(doc).stem.upper()
+            skill_md += f"- [{doc_name}](references/{Path(doc).name})\n"
     
     # Add key files section
     skill_md += """
@@ -657,17 +966,20 @@ See `references/` for detailed documentation:
 |------|---------|
 """
     
+    def src_has(stem: str) -> bool:
+        return any(name.startswith(stem + ".") for name in index.src_entries)
+    
+    # Resolved against the index: no filesystem globbing per row
     key_patterns = [
-        ("src/main.*", "Application entry point"),
-        ("src/lib.*", "Library exports"),
-        ("src/index.*", "Module entry"),
-        ("config/*", "Configuration"),
-        ("tests/*", "Test suite"),
+        ("src/main.*", "Application entry point", src_has("main")),
+        ("src/lib.*", "Library exports", src_has("lib")),
+        ("src/index.*", "Module entry", src_has("index")),
+        ("config/*", "Configuration", index.has_config_dir),
+        ("tests/*", "Test suite", index.has_tests_dir),
     ]
     
-    for pattern, purpose in key_patterns:
-        matches = list(repo_path.glob(pattern))
-        if matches:
+    for pattern, purpose, present in key_patterns:
+        if present:
             skill_md += f"| `{pattern}` | {purpose} |\n"
     
     return skill_md
@@ -677,67 +989,489 @@ See `references/` for detailed documentation:
 # Main Generator
 # ============================================================================
 
-def clone_repo(url: str, target: Path) -> bool:
-    """Clone a git repository."""
+# Fail fast on stalled transfers instead of hanging, and never block on a
+# credential prompt nobody will answer
+_GIT_NETWORK_ENV = {
+    "GIT_HTTP_LOW_SPEED_LIMIT": "1000",  # bytes/second ...
+    "GIT_HTTP_LOW_SPEED_TIME": "10",     # ... sustained for this many seconds
+    "GIT_TERMINAL_PROMPT": "0",
+}
+
+
+def _clone_config() -> list[str]:
+    """git -c options for clones and fetches.
+    
+    Received packs are already zlib-compressed, so skip recompressing,
+    index them with every core, and use HTTP/2 where curl supports it.
+    """
+    return [
+        "-c", "protocol.version=2",
+        "-c", "core.compression=0",
+        "-c", f"pack.threads={os.cpu_count() or 1}",
+        "-c", "http.version=HTTP/2",
+    ]
+
+
+def _run_git(args: list[str], extra_env: Optional[dict[str, str]] = None) -> tuple[int, str]:
+    """Run git with stdout discarded; return (exit code, tail of stderr).
+    
+    git is resolved to an absolute path and close_fds is off, which lets
+    CPython start it with posix_spawn instead of fork+exec. Python's own
+    descriptors are non-inheritable, so nothing leaks into the child.
+    """
+    import shutil
+    import subprocess
+    
+    git = shutil.which("git")
+    if git is None:
+        return 127, "git not found on PATH"
+    
+    argv = [git, "-c", "advice.detachedHead=false", "-c", "core.fsmonitor=false", *args]
+    with subprocess.Popen(
+        argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, close_fds=False,
+        env={**os.environ, **extra_env} if extra_env else None,
+    ) as proc:
+        # Drain as it arrives, keeping only the last lines for error messages
+        stderr_tail = deque(proc.stderr, maxlen=20)
+    return proc.returncode, b"".join(stderr_tail).decode(errors="replace")
+
+
+def clone_repo(url: str, target: Path, sparse: bool = False) -> bool:
+    """Clone a git repository (shallow, blobless, default branch only).
+    
+    With sparse, only what the analyzers read is checked out; see
+    _sparse_checkout.
+    """
+    clone = [*_clone_config(), "clone", "--depth", "1", "--filter=blob:none",
+             "--single-branch", "--no-tags"]
+    if sparse:
+        clone.append("--no-checkout")
+    returncode, stderr = _run_git(clone + [url, str(target)], extra_env=_GIT_NETWORK_ENV)
+    if returncode == 0 and sparse:
+        returncode, stderr = _sparse_checkout(target)
+    if returncode != 0:
+        print(f"Error cloning repo: {stderr}", file=sys.stderr)
+        return False
+    return True
+
+
+def _sparse_checkout(target: Path) -> tuple[int, str]:
+    """Check out the root, docs/ and directories holding YAML files of a clone.
+    
+    That covers every file read when not vendoring (root configs, docs,
+    Kubernetes manifests). The index is listed from HEAD's tree, so it still
+    sees the whole repository; with a blobless clone the skipped blobs are
+    never downloaded.
+    """
+    listing = _git_listing(target)
+    if listing is None:
+        return 1, "could not list HEAD"
+    
+    cone = {"docs"}
+    for rel, children in listing.items():
+        if rel and any(is_file and name.endswith((".yaml", ".yml")) for name, _, is_file in children):
+            cone.add(rel.rstrip("/"))
+    
+    git_dir = ["-C", str(target)]
+    returncode, stderr = _run_git(git_dir + ["sparse-checkout", "set", "--cone", *sorted(cone)])
+    if returncode == 0:
+        # Fetches the blobs of the checked-out paths
+        returncode, stderr = _run_git(git_dir + ["checkout", "HEAD"], extra_env=_GIT_NETWORK_ENV)
+    return returncode, stderr
+
+
+def _tar_extract_args() -> dict:
+    """Extraction arguments that skip unsafe members instead of failing.
+    
+    tarfile's data filter (where available) rejects absolute paths and
+    links escaping the destination by raising, which would abort the whole
+    extraction over e.g. a `localtime -> /etc/localtime` symlink; such
+    members are dropped instead.
+    """
+    import tarfile
+    
+    if not hasattr(tarfile, "data_filter"):
+        return {}
+    
+    def skip_unsafe(member, dest_path):
+        try:
+            return tarfile.data_filter(member, dest_path)
+        except tarfile.FilterError:
+            return None
+    
+    return {"filter": skip_unsafe}
+
+
+def _fetch_github_tarball(url: str, target: Path) -> bool:
+    """Download a GitHub repository's default branch as a tarball into target.
+    
+    Returns False for non-GitHub URLs or on any download/extract failure, so
+    the caller can fall back to git.
+    """
+    match = _GITHUB_URL_RE.match(url)
+    if not match:
+        return False
+    
+    import http.client
+    import tarfile
+    import urllib.error
+    import urllib.request
+    
+    owner, repo = match.groups()
+    request = urllib.request.Request(
+        f"https://api.github.com/repos/{owner}/{repo}/tarball",
+        headers={"User-Agent": "skillify", "Accept": "application/vnd.github+json"},
+    )
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        request.add_header("Authorization", f"Bearer {token}")
+    
+    extract_args = _tar_extract_args()
+    
     try:
-        subprocess.run(
-            ["git", "clone", "--depth", "1", url, str(target)],
-            check=True,
-            capture_output=True,
-        )
+        with urllib.request.urlopen(request, timeout=60) as resp, \
+                tarfile.open(fileobj=resp, mode="r|gz") as tar:
+            target.mkdir(parents=True, exist_ok=True)
+            for member in tar:
+                # Strip the "<owner>-<repo>-<sha>/" top-level directory
+                name = member.name.partition("/")[2]
+                if not name or name.startswith("/") or ".." in name.split("/"):
+                    continue
+                member.name = name
+                if member.islnk():
+                    member.linkname = member.linkname.partition("/")[2]
+                tar.extract(member, target, **extract_args)
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error cloning repo: {e.stderr.decode()}", file=sys.stderr)
+    except (urllib.error.URLError, http.client.HTTPException, tarfile.TarError, OSError) as e:
+        # HTTPException covers a connection dropped mid-stream (IncompleteRead)
+        print(f"Tarball download failed ({e}), trying git archive", file=sys.stderr)
+        import shutil
+        shutil.rmtree(target, ignore_errors=True)
         return False
 
 
+def _fetch_archive(url: str, target: Path) -> bool:
+    """Materialize HEAD of a remote repository into target, without a .git.
+    
+    GitHub URLs use the tarball download. Other hosts get a shallow bare
+    clone whose HEAD is piped through `git archive` into tarfile, which
+    skips building a worktree checkout and leaves no .git behind.
+    """
+    if _fetch_github_tarball(url, target):
+        return True
+    
+    import shutil
+    import subprocess
+    import tarfile
+    
+    bare = target.with_name(target.name + ".git")
+    try:
+        # No blob filter here: archive would fetch missing blobs one by one
+        returncode, stderr = _run_git([
+            *_clone_config(),
+            "clone", "--bare", "--depth", "1", "--single-branch", "--no-tags",
+            url, str(bare),
+        ], extra_env=_GIT_NETWORK_ENV)
+        if returncode != 0:
+            print(f"Error cloning repo: {stderr}", file=sys.stderr)
+            return False
+        
+        with subprocess.Popen(
+            [shutil.which("git"), "-C", str(bare), "archive", "--format=tar", "HEAD"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=False,
+        ) as proc:
+            with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+                tar.extractall(target, **_tar_extract_args())
+        if proc.returncode == 0:
+            return True
+        print(f"Error: git archive exited with {proc.returncode}", file=sys.stderr)
+    except (tarfile.TarError, OSError) as e:
+        print(f"Error extracting archive: {e}", file=sys.stderr)
+    finally:
+        shutil.rmtree(bare, ignore_errors=True)
+    
+    shutil.rmtree(target, ignore_errors=True)  # Leave target free for a clone
+    return False
+
+
+def _cached_repo_path(url: str) -> Path:
+    """Return the on-disk cache location for a repository URL."""
+    import hashlib
+    
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return cache_root / "skillify" / "repos" / key / "repo"
+
+
+def _open_cached_repo(url: str, repo_path: Path):
+    """Clone or refresh a cached repository and hold a shared lock on it.
+    
+    The refresh runs under an exclusive flock on a sibling .lock file, which
+    is then downgraded so concurrent runs can analyze the same checkout but
+    not refresh it underneath each other. Returns the open lock file; close
+    it to release the lock.
+    """
+    try:
+        import fcntl
+    except ImportError:  # No flock (Windows): run unlocked
+        fcntl = None
+    
+    repo_path.parent.mkdir(parents=True, exist_ok=True)
+    lock = open(repo_path.parent / ".lock", "w")
+    try:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        
+        if (repo_path / ".git").exists():
+            print(f"Updating cached clone of {url}...")
+            git_dir = ["-C", str(repo_path)]
+            returncode, stderr = _run_git(
+                git_dir + [*_clone_config(), "fetch", "--depth=1", "--no-tags", "origin", "HEAD"],
+                extra_env=_GIT_NETWORK_ENV,
+            )
+            if returncode == 0:
+                returncode, stderr = _run_git(git_dir + ["reset", "--hard", "FETCH_HEAD"])
+            if returncode != 0:
+                print(f"Warning: refresh failed, using cached copy: {stderr.strip()}", file=sys.stderr)
+        else:
+            import shutil
+            shutil.rmtree(repo_path, ignore_errors=True)  # Drop any half-written clone
+            print(f"Cloning {url} into cache...")
+            if not clone_repo(url, repo_path):
+                raise RuntimeError(f"Failed to clone {url}")
+        
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_SH)
+    except BaseException:
+        lock.close()
+        raise
+    return lock
+
+
+# Top-level entries left out of the local-path sandbox
+SANDBOX_SKIP = {".git", "node_modules", "__pycache__", "venv", "dist", "build"}
+
+
+def _materialize_local(repo_path: Path) -> tuple[Path, frozenset[str]]:
+    """Mirror a local directory's top level as symlinks in a temporary sandbox.
+    
+    Heavy directories are left out and no bytes are copied. Symlinks the
+    repository itself has are copied as links, so the walk treats them as
+    it would in place. Returns the sandbox, which keeps the repository's
+    name, and the names of the directory links the walk should follow;
+    remove the sandbox's parent directory when done (that only unlinks).
+    """
+    import tempfile
+    
+    sandbox = Path(tempfile.mkdtemp(prefix="skillify-local-")) / repo_path.name
+    sandbox.mkdir()
+    linked_dirs = set()
+    with os.scandir(repo_path) as it:
+        for entry in it:
+            if entry.name in SANDBOX_SKIP:
+                continue
+            if entry.is_symlink():
+                # Relative targets must keep resolving against the repository
+                target = os.path.join(repo_path, os.readlink(entry.path))
+                os.symlink(target, sandbox / entry.name)
+                continue
+            is_dir = entry.is_dir(follow_symlinks=False)
+            os.symlink(entry.path, sandbox / entry.name, target_is_directory=is_dir)
+            if is_dir:
+                linked_dirs.add(entry.name)
+    return sandbox, frozenset(linked_dirs)
+
+
+# Background deletions of discarded clones, joined briefly at exit
+_TRASH_JOIN_TIMEOUT = 5  # seconds, for all pending deletions together
+_trash_threads = []
+
+
+def _join_trash_threads():
+    """Give pending background deletions a last chance to finish."""
+    import time
+    
+    deadline = time.monotonic() + _TRASH_JOIN_TIMEOUT
+    for thread in _trash_threads:
+        thread.join(max(0, deadline - time.monotonic()))
+
+
+def _stale_trash(parent: Path) -> list[Path]:
+    """Return .trash-<pid>-* directories in parent left by exited processes.
+    
+    Those are deletions cut short at exit (the atexit join timed out, or a
+    pool worker exited without running atexit hooks).
+    """
+    if os.name == "nt":
+        return []  # os.kill(pid, 0) would terminate the process on Windows
+    
+    stale = []
+    try:
+        with os.scandir(parent) as it:
+            for entry in it:
+                if not entry.name.startswith(".trash-"):
+                    continue
+                try:
+                    pid = int(entry.name.split("-")[1])
+                    if pid == os.getpid():
+                        continue
+                    os.kill(pid, 0)
+                except ProcessLookupError:
+                    stale.append(Path(entry.path))
+                except (ValueError, IndexError, OSError):
+                    continue  # Not ours, or the process is still alive
+    except OSError:
+        pass
+    return stale
+
+
+def _remove_trees(paths: list[Path]):
+    """Delete directory trees, ignoring errors."""
+    import shutil
+    
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _discard_dir(path: str):
+    """Remove a directory tree without waiting for it.
+    
+    The directory is renamed to a hidden sibling (O(1) on one filesystem) and
+    deleted from a daemon thread, so unlinking a large clone stays off the
+    critical path; stale siblings of earlier runs are deleted along with
+    it. Falls back to a synchronous rmtree if the rename fails.
+    """
+    import shutil
+    import threading
+    import uuid
+    
+    parent = Path(path).parent
+    trash = parent / f".trash-{os.getpid()}-{uuid.uuid4().hex}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    
+    if not _trash_threads:
+        import atexit
+        atexit.register(_join_trash_threads)
+    thread = threading.Thread(
+        target=_remove_trees, args=([trash, *_stale_trash(parent)],), daemon=True,
+    )
+    thread.start()
+    _trash_threads.append(thread)
+
+
 def generate_skill(
     source: str,
     output_dir: Optional[Path] = None,
     keep_clone: bool = False,
     vendor: bool = False,
+    fast: bool = False,
+    use_cache: bool = False,
+    archive: bool = True,
+    pack_references: bool = False,
+    sandbox: bool = False,
+    output_root: Optional[Path] = None,
+    defer_cleanup: bool = True,
+    claim_dir: Optional[Path] = None,
 ) -> Path:
-    """Generate a skill from a repository."""
+    """Generate a skill from a repository.
+    
+    With use_cache, URL sources are kept in a clone under
+    ~/.cache/skillify/repos/ and refreshed with a shallow fetch on later
+    runs; keep_clone does not apply to the cache. Otherwise URL sources are
+    fetched as a HEAD snapshot without .git (archive=True, unless keep_clone)
+    or cloned, with a sparse checkout unless vendoring or keeping the clone.
+    
+    With pack_references, documentation goes into a single uncompressed
+    references/references.tar instead of one file per document.
+    
+    With sandbox, local directories are analyzed through a symlink sandbox
+    (see _materialize_local).
+    
+    output_root, used when output_dir is not given, replaces ./skills as
+    the directory the skill is created in.
+    
+    defer_cleanup deletes the temporary fetch directory in the background
+    (see _discard_dir); callers about to exit should pass False.
+    
+    claim_dir, shared by the jobs of a batch, makes skill names unique
+    across them (see _claim_skill_name).
+    """
     
     # Determine if source is URL or local path
-    is_url = source.startswith("http://") or source.startswith("https://") or source.startswith("git@")
+    is_url = source.startswith(("http://", "https://", "git@"))
     
-    if is_url:
+    temp_dir = None
+    sandbox_dir = None
+    follow_top_level = frozenset()
+    cache_lock = None
+    
+    if is_url and use_cache:
+        repo_path = _cached_repo_path(source)
+        cache_lock = _open_cached_repo(source, repo_path)
+    elif is_url:
         # Clone to temp directory
+        import tempfile
         temp_dir = tempfile.mkdtemp(prefix="repo-skill-gen-")
         repo_path = Path(temp_dir) / "repo"
-        print(f"Cloning {source}...")
-        if not clone_repo(source, repo_path):
+        print(f"Fetching {source}...")
+        fetched = False
+        if archive and not keep_clone:  # A kept clone should be a real clone
+            fetched = _fetch_archive(source, repo_path)
+            if not fetched:
+                print("Archive fetch failed, falling back to git clone", file=sys.stderr)
+        if not fetched:
+            # Vendoring copies the whole tree, and a kept clone should be complete
+            fetched = clone_repo(source, repo_path, sparse=not (vendor or keep_clone))
+        if not fetched:
             raise RuntimeError(f"Failed to clone {source}")
     else:
         repo_path = Path(source).resolve()
         if not repo_path.exists():
             raise FileNotFoundError(f"Repository not found: {source}")
-        temp_dir = None
+    
+    # Vendoring copies the real tree, not the sandbox
+    source_path = repo_path
     
     try:
+        if sandbox and not is_url and repo_path.is_dir():
+            repo_path, follow_top_level = _materialize_local(repo_path)
+            sandbox_dir = repo_path.parent
+        
         print(f"Analyzing {repo_path.name}...")
         
+        # Walk the repository once; every analyzer reads from the index
+        # Clones made here match HEAD, so git can list them without a walk
+        index = _build_index(
+            repo_path, follow_top_level=follow_top_level, use_git=is_url,
+        )
+        
         # Detect project type
-        project_types = detect_project_type(repo_path)
+        project_types = detect_project_type(index, fast=fast)
         print(f"  Detected types: {', '.join(project_types)}")
         
-        # Get metadata
-        metadata = get_project_metadata(repo_path, project_types)
-        print(f"  Project name: {metadata['name']}")
-        
-        # Get README
-        readme = get_readme_content(repo_path)
-        
-        # Get directory tree
-        tree = get_directory_tree(repo_path)
+        # The remaining stages are independent and mostly wait on file reads,
+        # so run them in threads; print afterwards to keep the output ordered
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            # Fetched repos live in a directory named "repo"; name them by URL
+            default_name = _repo_name_from_url(source) if is_url else None
+            metadata_f = pool.submit(get_project_metadata, index, project_types, default_name)
+            readme_f = pool.submit(get_readme_content, index)
+            tree_f = pool.submit(get_directory_tree, index)
+            entry_points_f = pool.submit(detect_entry_points, index, project_types)
+            key_files_f = pool.submit(extract_key_files, index)
+            
+            metadata = metadata_f.result()
+            readme = readme_f.result()
+            tree = tree_f.result()
+            entry_points = entry_points_f.result()
+            key_files = key_files_f.result()
         
-        # Detect entry points
-        entry_points = detect_entry_points(repo_path, project_types)
+        print(f"  Project name: {metadata['name']}")
         print(f"  Found {len(entry_points)} entry points")
-        
-        # Extract key files
-        key_files = extract_key_files(repo_path)
         print(f"  Found {len(key_files)} documentation files")
         
         # Determine output directory
@@ -745,32 +1479,57 @@ def generate_skill(
         if output_dir:
             skill_path = Path(output_dir)
         else:
-            skill_path = Path.cwd() / "skills" / skill_name
+            if claim_dir:
+                claimed = _claim_skill_name(Path(claim_dir), skill_name)
+                if claimed != skill_name:
+                    print(f"  Skill name '{skill_name}' already used in this batch, using '{claimed}'")
+                skill_name = claimed
+            skill_path = Path(output_root or Path.cwd() / "skills") / skill_name
+        
+        # Create the whole output layout up front, one makedirs per leaf
+        refs_path = skill_path / "references"
+        scripts_path = skill_path / "scripts"
+        leaves = [refs_path, scripts_path]
+        if vendor:
+            leaves += [skill_path / "input", skill_path / "output"]
+        for leaf in leaves:
+            os.makedirs(leaf, exist_ok=True)
         
-        skill_path.mkdir(parents=True, exist_ok=True)
+        # References are named by basename, so e.g. README.md and
+        # docs/README.md collide; the later one in DOC_FILES order wins
+        references = {Path(doc_file).name: content for doc_file, content in key_files.items()}
         
         # Generate SKILL.md
         print(f"Generating skill at {skill_path}...")
         skill_md = generate_skill_md(
-            repo_path, project_types, metadata, entry_points, tree, readme
+            index, project_types, metadata, entry_points, tree, readme,
+            packed_references=list(references) if pack_references else None,
         )
         (skill_path / "SKILL.md").write_text(skill_md)
         
-        # Create references directory
-        refs_path = skill_path / "references"
-        refs_path.mkdir(exist_ok=True)
-        
-        for doc_file, content in key_files.items():
-            ref_name = Path(doc_file).name
-            (refs_path / ref_name).write_text(content)
-        
-        # Create scripts directory
-        scripts_path = skill_path / "scripts"
-        scripts_path.mkdir(exist_ok=True)
+        if pack_references:
+            # One sequential write instead of a small file per document
+            import io
+            import tarfile
+            with tarfile.open(refs_path / "references.tar", "w") as tar:
+                for ref_name, content in references.items():
+                    data = content.encode()
+                    info = tarfile.TarInfo(ref_name)
+                    info.size = len(data)
+                    tar.addfile(info, io.BytesIO(data))
+        elif references:
+            # Write references concurrently; after deduplication each is its own file
+            def write_ref(item):
+                ref_name, content = item
+                (refs_path / ref_name).write_bytes(content.encode())
+            
+            with ThreadPoolExecutor(max_workers=min(8, len(references))) as pool:
+                list(pool.map(write_ref, references.items()))
         
         # Vendor the codebase if requested
         if vendor:
             print("Vendoring codebase...")
+            import shutil
             vendor_path = skill_path / "vendor"
             if vendor_path.exists():
                 shutil.rmtree(vendor_path)
@@ -781,11 +1540,11 @@ def generate_skill(
                          ".pytest_cache", "target", "dist", ".next", ".cache"}
                 return [f for f in files if f in ignore]
             
-            shutil.copytree(repo_path, vendor_path, ignore=ignore_patterns)
+            shutil.copytree(source_path, vendor_path, ignore=ignore_patterns)
             print(f"  Copied to vendor/")
             
             # Detect LLM usage
-            llm_findings = detect_llm_usage(repo_path)
+            llm_findings = detect_llm_usage(index)
             if llm_findings["has_llm_calls"]:
                 print(f"  ⚠️  LLM API calls detected ({', '.join(llm_findings['providers'])})")
                 print(f"     Files: {', '.join(llm_findings['files'][:3])}")
@@ -802,16 +1561,16 @@ def generate_skill(
             (scripts_path / "entrypoint.py").write_text(entrypoint)
             (scripts_path / "entrypoint.py").chmod(0o755)
             print(f"  Generated scripts/entrypoint.py")
-            
-            # Create input/output dirs
-            (skill_path / "input").mkdir(exist_ok=True)
-            (skill_path / "output").mkdir(exist_ok=True)
         else:
-            (scripts_path / ".gitkeep").touch()
+            gitkeep = os.path.join(scripts_path, ".gitkeep")
+            os.close(os.open(gitkeep, os.O_WRONLY | os.O_CREAT, 0o644))
         
         print(f"\n✅ Skill generated at: {skill_path}")
         print(f"   - SKILL.md")
-        print(f"   - references/ ({len(key_files)} files)")
+        if pack_references:
+            print(f"   - references/references.tar ({len(references)} files)")
+        else:
+            print(f"   - references/ ({len(references)} files)")
         if vendor:
             print(f"   - vendor/ (full codebase)")
             print(f"   - init.sh (setup script)")
@@ -823,12 +1582,90 @@ def generate_skill(
         return skill_path
         
     finally:
-        # Cleanup temp directory
+        if cache_lock:
+            cache_lock.close()
+        
+        if sandbox_dir:
+            import shutil
+            shutil.rmtree(sandbox_dir, ignore_errors=True)
+        
+        # Cleanup temp directory (never the cache)
         if temp_dir and not keep_clone:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            if defer_cleanup:
+                _discard_dir(temp_dir)
+            else:
+                import shutil
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _repo_name_from_url(url: str) -> str:
+    """Return the repository name of a git URL ("org/repo.git" -> "repo")."""
+    path = url.rstrip("/")
+    if path.endswith(".git"):
+        path = path[:-4]
+    return re.split(r"[/:]", path)[-1] or "repo"
+
+
+def _claim_skill_name(claim_dir: Path, name: str) -> str:
+    """Reserve a skill name for this batch, suffixing "-2", "-3"... if taken.
+    
+    Claims are files created with O_EXCL, so concurrent workers never end
+    up writing into the same skill directory.
+    """
+    candidate, n = name, 1
+    while True:
+        try:
+            os.close(os.open(claim_dir / candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+            return candidate
+        except FileExistsError:
+            n += 1
+            candidate = f"{name}-{n}"
+
+
+def _generate_one(job: tuple[str, dict]) -> tuple[str, Optional[Path], Optional[str]]:
+    """Run one --batch item in a worker process: (source, skill path, error)."""
+    source, options = job
+    try:
+        return source, generate_skill(source, **options), None
+    except Exception as e:
+        return source, None, str(e)
+
+
+def _run_batch(sources: list[str], jobs: int, options: dict) -> bool:
+    """Generate skills for many sources in a process pool; True if all succeeded."""
+    import shutil
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+    
+    # Skill names taken so far, so no two jobs write the same directory
+    claim_dir = tempfile.mkdtemp(prefix="skillify-batch-")
+    options = {**options, "claim_dir": claim_dir}
+    
+    failed = 0
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for source, skill_path, error in pool.map(
+                _generate_one, [(source, options) for source in sources], chunksize=4,
+            ):
+                if error is None:
+                    print(f"✅ {source} -> {skill_path}")
+                else:
+                    failed += 1
+                    print(f"❌ {source}: {error}", file=sys.stderr)
+    finally:
+        shutil.rmtree(claim_dir, ignore_errors=True)
+    
+    # Workers exit without running atexit hooks, so deletions still running
+    # then are cut short; the workers are gone now, finish them here
+    _remove_trees(_stale_trash(Path(tempfile.gettempdir())))
+    
+    print(f"\n{len(sources) - failed}/{len(sources)} skills generated")
+    return failed == 0
 
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Generate an OpenClaw skill from a repository",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -838,32 +1675,95 @@ Examples:
     python generate.py /path/to/local/repo
     python generate.py https://github.com/org/repo --output ./skills/my-skill
     python generate.py . --output ./my-project-skill
+    python generate.py --batch repos.txt --output ./skills --cache
         """,
     )
     parser.add_argument(
         "source",
+        nargs="?",
         help="Repository URL or local path",
     )
     parser.add_argument(
         "--output", "-o",
         type=Path,
-        help="Output directory for the skill (default: ./skills/<repo-name>)",
+        help="Output directory for the skill (default: ./skills/<repo-name>); "
+             "with --batch, the directory the skills are created in",
+    )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        metavar="PATH",
+        help="Generate a skill for every source listed in PATH, one per line",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of --batch sources processed in parallel (default: CPU count)",
     )
     parser.add_argument(
         "--keep-clone",
         action="store_true",
         help="Keep the cloned repository (for URLs)",
     )
+    parser.add_argument(
+        "--archive",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Fetch URLs as a HEAD snapshot without .git (default, except with "
+             "--keep-clone); --no-archive makes a regular git clone",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse a cached clone under ~/.cache/skillify/repos/ (for URLs)",
+    )
     parser.add_argument(
         "--vendor",
         action="store_true",
         help="Vendor the full codebase into the skill (enables execution)",
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip overlay type detection (terraform, docker, k8s)",
+    )
+    parser.add_argument(
+        "--pack-references",
+        action="store_true",
+        help="Write documentation as a single references/references.tar",
+    )
+    parser.add_argument(
+        "--sandbox",
+        action="store_true",
+        help="Analyze local directories through a temporary symlink sandbox",
+    )
     
     args = parser.parse_args()
+    if (args.source is None) == (args.batch is None):
+        parser.error("give either a source or --batch PATH")
+    
+    if args.batch:
+        try:
+            lines = args.batch.read_text().splitlines()
+        except OSError as e:
+            parser.error(f"cannot read {args.batch}: {e}")
+        sources = [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+        options = {
+            "keep_clone": args.keep_clone, "vendor": args.vendor, "fast": args.fast,
+            "use_cache": args.cache, "archive": args.archive,
+            "pack_references": args.pack_references, "sandbox": args.sandbox,
+            "output_root": args.output,
+        }
+        sys.exit(0 if _run_batch(sources, max(1, args.jobs), options) else 1)
     
     try:
-        skill_path = generate_skill(args.source, args.output, args.keep_clone, args.vendor)
+        skill_path = generate_skill(
+            args.source, args.output, args.keep_clone, args.vendor, args.fast,
+            use_cache=args.cache, archive=args.archive,
+            pack_references=args.pack_references, sandbox=args.sandbox,
+            defer_cleanup=False,  # The process exits right after
+        )
         print(f"\nNext steps:")
         print(f"  1. Review and edit {skill_path}/SKILL.md")
         print(f"  2. Add any custom scripts to {skill_path}/scripts/")